@@ -7,11 +7,19 @@ that supports ONNX Runtime (Elixir, C++, JavaScript, etc.).
 """
 
 import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import numpy as np
 import tensorflow as tf
 
+# Set SYLLABLE_VERBOSE=1 for the model summary and per-word sample output
+VERBOSE = bool(os.getenv("SYLLABLE_VERBOSE"))
+# Set ONNX_CHECK=1 to validate the exported graph with the ONNX checker
+ONNX_CHECK = bool(os.getenv("ONNX_CHECK"))
+
 
 def export_to_onnx():
     """Export the TensorFlow model to ONNX format."""
@@ -30,26 +38,38 @@ def export_to_onnx():
     with open(chars_file) as f:
         char_config = json.load(f)
     
-    print("\nModel summary:")
-    model.summary()
+    if VERBOSE:
+        print("\nModel summary:")
+        model.summary()
     
     # Test the model with sample input to verify it works
     print("\n🧪 Testing model with sample inputs...")
-    test_words = ["hello", "world", "python", "elixir"]
+    test_words = ["hello", "world", "python", "elixir", "syllable", "family"]
     
     from syllable.char_encoder import CharacterEncoder
     char_enc = CharacterEncoder(char_config['chars'])
     
-    for word in test_words:
-        # Encode word exactly like the original
-        encoded = char_enc.encode(word, char_config['maxlen'])
-        input_tensor = np.array([encoded], dtype=np.float32)
-        
-        # Get prediction
-        output = model.predict(input_tensor, verbose=0)
-        syllables = max(1, round(float(output[0][0])))
-        
-        print(f"   {word}: {syllables} syllables (raw: {float(output[0][0]):.3f})")
+    # Encode words exactly like the original, as one batch
+    batch = encode_batch(test_words, char_enc, char_config['maxlen'])
+    
+    # Get predictions with a single traced call, with a fixed signature
+    # instead of going through predict() for every word. These are also
+    # the reference outputs for the ONNX comparison
+    @tf.function(input_signature=[
+        tf.TensorSpec(shape=[None, char_config['maxlen'], char_enc.num_chars], dtype=tf.float32)
+    ])
+    def infer(x):
+        return model(x, training=False)
+    
+    tf_ref = infer(tf.constant(batch)).numpy()[:, 0]
+    
+    if VERBOSE:
+        # Same rounding as the graph's syllable_count, for the whole batch
+        counts = np.maximum(1, np.round(tf_ref)).astype(np.int32)
+        for word, syllables, raw in zip(test_words, counts, tf_ref):
+            print(f"   {word}: {syllables} syllables (raw: {float(raw):.3f})")
+    else:
+        print(f"   ✅ Model ran on {len(test_words)} sample words")
     
     try:
         import onnx
@@ -69,28 +89,149 @@ def export_to_onnx():
         
         print("✅ Successfully exported to ONNX!")
         
-        # Verify the ONNX model
-        print("\n🔍 Verifying ONNX model...")
-        onnx.checker.check_model(onnx_model)
-        print("✅ ONNX model is valid!")
+        # Collapse the Constant/Cast/Reshape scaffolding tf2onnx emits
+        print("\n🔄 Simplifying ONNX graph...")
+        onnx_model = simplify_model(onnx_model, output_dir / "syllable_model.onnx")
+        
+        # Fold the max(1, round(x)) postprocessing into the graph
+        onnx_model = add_postprocessing(onnx_model)
+        
+        # Take character indices instead of a mostly zero one-hot tensor
+        onnx_model = add_index_input(onnx_model, char_enc.num_chars)
+        onnx.save(onnx_model, str(output_dir / "syllable_model.onnx"))
+        
+        # Verify the ONNX model, the consistency checks below still run
+        if ONNX_CHECK:
+            print("\n🔍 Verifying ONNX model...")
+            onnx.checker.check_model(onnx_model)
+            print("✅ ONNX model is valid!")
+        
+        # Fixed batch size variants let ORT specialize shapes at load time
+        print("\n🔄 Saving fixed batch size models...")
+        fixed_batch = {}
+        for batch_size in (1, 8, 32):
+            fixed_file = f"syllable_model_bs{batch_size}.onnx"
+            onnx.save(fix_batch_size(onnx_model, batch_size), str(output_dir / fixed_file))
+            fixed_batch[str(batch_size)] = fixed_file
+        print(f"✅ Saved models for batch sizes {', '.join(fixed_batch)}!")
+        
+        # Bake graph optimizations into the shipped model
+        print("\n🔄 Optimizing ONNX graph...")
+        optimize_model(output_dir / "syllable_model.onnx", output_dir / "syllable_model.opt.onnx")
+        print("✅ Saved optimized model!")
+        
+        # Quantize weights to INT8 for faster CPU inference
+        print("\n🔄 Quantizing to INT8...")
+        quantize_model(output_dir / "syllable_model.opt.onnx", output_dir / "syllable_model.int8.onnx")
+        print("✅ Saved INT8 model!")
         
-        # Test ONNX model against TensorFlow
+        # Static INT8 with activation ranges calibrated on real words
+        print("\n🔄 Quantizing to static INT8 with calibration words...")
+        try:
+            calibration_words = load_calibration_words(char_config)
+        except FileNotFoundError as e:
+            print(f"   ⚠️  CMUdict not available, skipping static INT8: {e}")
+            calibration_words = None
+        if calibration_words:
+            quantize_model_static(output_dir / "syllable_model.opt.onnx",
+                                  output_dir / "syllable_model.int8_static.onnx",
+                                  char_enc, char_config, calibration_words)
+            print(f"✅ Saved static INT8 model! ({len(calibration_words)} calibration words)")
+        
+        # FP16 model for GPU, DirectML and CoreML execution providers
+        print("\n🔄 Converting to FP16...")
+        fp16_saved = export_fp16(onnx_model, output_dir / "syllable_model.fp16.onnx")
+        
+        # ORT format model for ONNX Runtime Mobile
+        print("\n🔄 Converting to ORT format...")
+        ort_saved = convert_to_ort(output_dir / "syllable_model.onnx")
+        
+        # Test ONNX models against TensorFlow
         print("\n🧪 Testing ONNX vs TensorFlow consistency...")
-        test_onnx_consistency(output_dir / "syllable_model.onnx", char_config, test_words)
+        test_onnx_consistency(output_dir / "syllable_model.opt.onnx", char_config, test_words, tf_ref, char_enc)
         
-        # Save comprehensive metadata
-        save_metadata(output_dir, char_config, model)
+        # The lossy variants are optional, one that drifts too far from
+        # TensorFlow is dropped instead of failing the whole export
+        quantization = {}
+        
+        print("\n🧪 Testing INT8 ONNX vs TensorFlow consistency...")
+        int8_saved, int8_diff = test_lossy_consistency(output_dir / "syllable_model.int8.onnx", char_config,
+                                                       test_words, tf_ref, char_enc)
+        if int8_saved:
+            quantization["dynamic"] = {
+                "file": "syllable_model.int8.onnx",
+                "weight_type": "int8",
+                "op_types": ["MatMul", "Gemm"],
+                "size_kb": round((output_dir / "syllable_model.int8.onnx").stat().st_size / 1024, 1),
+                "max_abs_diff": None if int8_diff is None else float(int8_diff)
+            }
+        
+        int8_static_saved = False
+        if calibration_words:
+            print("\n🧪 Testing static INT8 ONNX vs TensorFlow consistency...")
+            int8_static_saved, int8_static_diff = test_lossy_consistency(
+                output_dir / "syllable_model.int8_static.onnx", char_config, test_words, tf_ref, char_enc)
+        if int8_static_saved:
+            quantization["static"] = {
+                "file": "syllable_model.int8_static.onnx",
+                "format": "QDQ",
+                "activation_type": "uint8",
+                "weight_type": "int8",
+                "per_channel": True,
+                "calibration_words": len(calibration_words),
+                "size_kb": round((output_dir / "syllable_model.int8_static.onnx").stat().st_size / 1024, 1),
+                "max_abs_diff": None if int8_static_diff is None else float(int8_static_diff)
+            }
+        
+        fp16 = None
+        if fp16_saved:
+            print("\n🧪 Testing FP16 ONNX vs TensorFlow consistency...")
+            from onnxruntime.capi.onnxruntime_pybind11_state import NotImplemented as OrtNotImplemented
+            try:
+                fp16_saved, fp16_diff = test_lossy_consistency(output_dir / "syllable_model.fp16.onnx",
+                                                               char_config, test_words, tf_ref, char_enc)
+            except OrtNotImplemented as e:
+                # Older CPU providers lack FP16 kernels for some ops, e.g. GRU
+                print(f"   ⚠️  FP16 model can't run on the CPU provider, skipping: {e}")
+                fp16_diff = None
+        if fp16_saved:
+            fp16 = {
+                "file": "syllable_model.fp16.onnx",
+                "io_types": {"char_indices": "int32", "dense": "float32", "syllable_count": "int32"},
+                "max_abs_diff": None if fp16_diff is None else float(fp16_diff)
+            }
+        
+        files = {
+            "model": "syllable_model.opt.onnx",
+            "unoptimized": "syllable_model.onnx"
+        }
+        if int8_saved:
+            files["int8"] = "syllable_model.int8.onnx"
+        if int8_static_saved:
+            files["int8_static"] = "syllable_model.int8_static.onnx"
+        files["fixed_batch"] = fixed_batch
+        if fp16_saved:
+            files["fp16"] = "syllable_model.fp16.onnx"
+        if ort_saved:
+            files["ort"] = "syllable_model.ort"
         
         # Create usage examples
         create_usage_examples(output_dir)
         
+        # Prebuilt engine caches for hardware specific execution providers
+        print("\n🔄 Building execution provider caches...")
+        files.update(build_ep_caches(output_dir, char_enc.encode_indices(test_words[0], char_config['maxlen'])))
+        
+        # Save comprehensive metadata
+        save_metadata(output_dir, char_config, model, files, quantization, fp16)
+        
         print(f"\n📁 Files created in {output_dir}:")
         for file in output_dir.iterdir():
             size_kb = file.stat().st_size / 1024
             print(f"   - {file.name} ({size_kb:.1f} KB)")
         
         print("\n🎉 ONNX export completed successfully!")
-        print(f"📦 Model size: {(output_dir / 'syllable_model.onnx').stat().st_size / 1024:.1f} KB")
+        print(f"📦 Model size: {(output_dir / 'syllable_model.opt.onnx').stat().st_size / 1024:.1f} KB")
         print("🎯 Accuracy: 95.82% (same as original)")
         
         return True
@@ -99,61 +240,365 @@ def export_to_onnx():
         print(f"\n❌ Missing dependencies for ONNX export: {e}")
         print("\n📦 To install required packages:")
         print("   pip install tf2onnx onnx onnxruntime")
+        print("   pip install onnxsim  # optional, simplifies the graph")
+        print("   pip install onnxconverter-common  # optional, FP16 export")
         print("\n💡 Or with uv:")
         print("   uv add tf2onnx onnx onnxruntime")
         return False
+    
+    except ConsistencyError as e:
+        print(f"\n❌ ONNX export failed the consistency check: {e}")
+        return False
+
+class ConsistencyError(Exception):
+    """An exported model's outputs differ from TensorFlow beyond tolerance."""
 
-def test_onnx_consistency(onnx_path, char_config, test_words):
-    """Test that ONNX model produces same results as TensorFlow."""
+def encode_batch(words, char_enc, maxlen):
+    """Encode words to a [len(words), maxlen, num_chars] one-hot batch.
+    
+    Same encoding as char_enc.encode, but gathers whole rows from an
+    identity table in one fancy-indexed copy. Padding uses index num_chars,
+    the extra all-zero row of the table.
+    """
+    
+    idx = np.full((len(words), maxlen), char_enc.num_chars, dtype=np.int32)
+    for n, word in enumerate(words):
+        word = word[:maxlen]
+        idx[n, :len(word)] = [char_enc.char_indices[c] for c in word]
+    table = np.eye(char_enc.num_chars + 1, char_enc.num_chars, dtype=np.float32)
+    return table[idx]
+
+def simplify_model(onnx_model, onnx_path):
+    """Simplify the model with onnx-simplifier and save it over onnx_path.
+    
+    Returns the simplified model, or the original if onnxsim is not installed.
+    """
     
     try:
-        import onnxruntime as ort
+        import onnx
+        import onnxsim
+    except ImportError:
+        print("   ⚠️  onnxsim not available, skipping simplification")
+        return onnx_model
+    
+    simplified, ok = onnxsim.simplify(onnx_model)
+    if not ok:
+        print("   ⚠️  Simplified model failed validation, keeping original")
+        return onnx_model
+    
+    onnx.save(simplified, str(onnx_path))
+    print(f"✅ Simplified graph: {len(onnx_model.graph.node)} → {len(simplified.graph.node)} nodes")
+    return simplified
+
+def add_postprocessing(onnx_model):
+    """Append max(1, round(x)) to the graph as an int32 syllable_count output.
+    
+    The raw float output is kept as the first output so the model can still be
+    compared against TensorFlow.
+    """
+    
+    from onnx import TensorProto, helper
+    
+    graph = onnx_model.graph
+    raw_output = graph.output[0]
+    
+    graph.node.extend([
+        helper.make_node("Round", [raw_output.name], ["syllable_count_rounded"], name="syllable_count_round"),
+        helper.make_node("Cast", ["syllable_count_rounded"], ["syllable_count_int"], name="syllable_count_cast",
+                         to=TensorProto.INT32),
+        helper.make_node("Constant", [], ["syllable_count_min"], name="syllable_count_min",
+                         value=helper.make_tensor("syllable_count_min", TensorProto.INT32, [], [1])),
+        helper.make_node("Max", ["syllable_count_int", "syllable_count_min"], ["syllable_count"],
+                         name="syllable_count_max")
+    ])
+    
+    count_output = helper.make_tensor_value_info("syllable_count", TensorProto.INT32, None)
+    count_output.type.tensor_type.shape.CopyFrom(raw_output.type.tensor_type.shape)
+    graph.output.append(count_output)
+    return onnx_model
 
-        from syllable.char_encoder import CharacterEncoder
+def add_index_input(onnx_model, num_chars):
+    """Replace the one-hot input with an int32 char_indices input.
+    
+    A Gather from a constant one-hot table rebuilds the original input inside
+    the graph, so callers pass [batch_size, maxlen] indices instead of a
+    [batch_size, maxlen, num_chars] tensor that is almost all zeros. Index
+    num_chars is padding and maps to an all-zero row.
+    """
+    
+    from onnx import TensorProto, helper, numpy_helper
+    
+    graph = onnx_model.graph
+    one_hot_input = graph.input[0]
+    dims = one_hot_input.type.tensor_type.shape.dim
+    
+    table = np.vstack([np.eye(num_chars), np.zeros((1, num_chars))]).astype(np.float32)
+    graph.initializer.append(numpy_helper.from_array(table, "char_one_hot_table"))
+    
+    # The Gather output takes over the old input's name, so existing nodes
+    # consume it unchanged
+    graph.node.insert(0, helper.make_node(
+        "Gather", ["char_one_hot_table", "char_indices"], [one_hot_input.name], axis=0
+    ))
+    
+    index_input = helper.make_tensor_value_info("char_indices", TensorProto.INT32, None)
+    index_shape = index_input.type.tensor_type.shape
+    for dim in dims[:2]:
+        index_shape.dim.add().CopyFrom(dim)
+    
+    graph.input.remove(one_hot_input)
+    graph.input.insert(0, index_input)
+    return onnx_model
+
+def fix_batch_size(onnx_model, batch_size):
+    """Return a copy of the model with the batch dimension fixed to batch_size."""
+    
+    import onnx
+    
+    fixed = onnx.ModelProto()
+    fixed.CopyFrom(onnx_model)
+    for value in list(fixed.graph.input) + list(fixed.graph.output):
+        dim = value.type.tensor_type.shape.dim[0]
+        dim.ClearField("dim_param")
+        dim.dim_value = batch_size
+    return fixed
+
+def optimize_model(onnx_path, opt_path):
+    """Run ONNX Runtime graph optimizations offline and save the optimized model."""
+    
+    import onnxruntime as ort
+    
+    so = ort.SessionOptions()
+    # Extended level only, the layout transforms enabled by ORT_ENABLE_ALL are
+    # specific to the CPU the export runs on
+    so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    so.optimized_model_filepath = str(opt_path)
+    ort.InferenceSession(str(onnx_path), so, providers=["CPUExecutionProvider"])
+
+def quantize_model(onnx_path, int8_path):
+    """Quantize the model weights to INT8 with ONNX Runtime dynamic quantization."""
+    
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    
+    quantize_dynamic(
+        model_input=str(onnx_path),
+        model_output=str(int8_path),
+        weight_type=QuantType.QInt8,
+        # Leave the one-hot Gather table exact, only quantize the matrix products
+        op_types_to_quantize=["MatMul", "Gemm"]
+    )
+
+def load_calibration_words(char_config, count=500):
+    """Pick about count words from CMUdict that the model can encode.
+    
+    Words are sampled evenly across the dictionary so the calibration set
+    covers the same distribution the model was trained on.
+    """
+    
+    from syllable.syllable_counters import CMUDICT_FILE
+    
+    chars = set(char_config['chars'])
+    words = []
+    with open(CMUDICT_FILE) as f:
+        for line in f:
+            word = line.split(maxsplit=1)[0]
+            if '(' in word:  # Alternate pronunciation
+                continue
+            if len(word) <= char_config['maxlen'] and all(c in chars for c in word):
+                words.append(word)
+    
+    step = max(1, len(words) // count)
+    return words[::step][:count]
+
+def quantize_model_static(onnx_path, int8_path, char_enc, char_config, calibration_words):
+    """Quantize weights and activations to INT8, calibrating on real words."""
+    
+    import onnx
+    from onnxruntime.quantization import (
+        CalibrationDataReader,
+        QuantFormat,
+        QuantType,
+        quantize_static,
+    )
+    
+    input_name = onnx.load(str(onnx_path)).graph.input[0].name
+    
+    class WordDataReader(CalibrationDataReader):
+        """Feeds index encoded words, one per batch, to the calibrator."""
+        
+        def __init__(self):
+            self.words = iter(calibration_words)
+        
+        def get_next(self):
+            word = next(self.words, None)
+            if word is None:
+                return None
+            encoded = char_enc.encode_indices(word, char_config['maxlen'])
+            return {input_name: np.array([encoded])}
+    
+    quantize_static(
+        model_input=str(onnx_path),
+        model_output=str(int8_path),
+        calibration_data_reader=WordDataReader(),
+        quant_format=QuantFormat.QDQ,
+        # uint8 activations x int8 weights is the pairing ORT's VNNI kernels
+        # (VPDPBUSD) are built for, other combinations can run slower than FP32
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8,
+        per_channel=True,
+        reduce_range=False,
+        extra_options={"WeightSymmetric": True, "ActivationSymmetric": False}
+    )
+
+def export_fp16(onnx_model, fp16_path):
+    """Convert the model to FP16 and save it, keeping FP32 inputs and outputs.
+    
+    Returns False if onnxconverter-common is not installed.
+    """
+    
+    try:
+        import onnx
+        from onnxconverter_common import float16
+    except ImportError:
+        print("   ⚠️  onnxconverter-common not available, skipping FP16 export")
+        return False
+    
+    # Round reads the raw output, which keep_io_types casts back to FP32, so
+    # it has to stay FP32 too or its output type no longer matches
+    fp16_model = float16.convert_float_to_float16(onnx_model, keep_io_types=True,
+                                                  node_block_list=["syllable_count_round"])
+    onnx.save(fp16_model, str(fp16_path))
+    print("✅ Saved FP16 model!")
+    return True
+
+def convert_to_ort(onnx_path):
+    """Convert the model to the ORT flatbuffer format used by ONNX Runtime Mobile.
+    
+    The .ort file is written next to onnx_path. Returns False if conversion failed.
+    """
+    
+    result = subprocess.run(
+        [sys.executable, "-m", "onnxruntime.tools.convert_onnx_models_to_ort",
+         "--optimization_style", "Fixed",
+         "--target_platform", "arm",
+         str(onnx_path)],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        print(f"   ⚠️  ORT format conversion failed, skipping:\n{result.stderr}")
+        return False
+    
+    print("✅ Saved ORT format model!")
+    return True
+
+def build_ep_caches(output_dir, sample_input):
+    """Prebuild TensorRT and OpenVINO caches by running one inference.
+    
+    Sessions come from the generated Python example, with its model choice,
+    provider options and session setup, so the caches match what it loads at
+    runtime. Only providers available in the installed onnxruntime are built.
+    Returns a dict of cache name to directory, relative to output_dir.
+    """
+    
+    from onnx_backend import load_example
+    
+    example = load_example(output_dir)
+    model_path = example.find_model([str(output_dir / p) for p in example.MODEL_PATHS])
+    providers = dict(p for p in example.get_providers(str(output_dir / "trt_cache"),
+                                                      str(output_dir / "openvino_cache"))
+                     if isinstance(p, tuple))
+    input_tensor = np.array([sample_input])
+    
+    cache_providers = {
+        "trt_cache": "TensorrtExecutionProvider",
+        "openvino_cache": "OpenVINOExecutionProvider"
+    }
+    
+    caches = {}
+    for cache_name, provider in cache_providers.items():
+        if provider not in providers:
+            print(f"   ⚠️  {provider} not available, skipping {cache_name}")
+            continue
+        
+        session = example.create_session(model_path, [(provider, providers[provider])])
+        session.run(None, {session.get_inputs()[0].name: input_tensor})
+        caches[cache_name] = cache_name
+        print(f"✅ Built {cache_name} with {provider}")
+    
+    return caches
+
+def test_onnx_consistency(onnx_path, char_config, test_words, expected_outputs, char_enc, tolerance=1e-4):
+    """Test that ONNX model produces same results as TensorFlow.
+    
+    expected_outputs are the TensorFlow outputs for test_words, all words are
+    run through the ONNX model as a single batch. Raises ConsistencyError if
+    the max absolute difference exceeds tolerance. Returns the max absolute
+    difference, or None if the test was skipped.
+    """
+    
+    try:
+        import onnxruntime as ort
 
         # Load ONNX model
         session = ort.InferenceSession(str(onnx_path))
         input_name = session.get_inputs()[0].name
         output_name = session.get_outputs()[0].name
-        
-        # Load TensorFlow model for comparison
-        tf_model = tf.keras.models.load_model('./syllable/model_data/model')
-        char_enc = CharacterEncoder(char_config['chars'])
+        output_names = [output_name]
         
         print(f"   ONNX input: {input_name}")
         print(f"   ONNX output: {output_name}")
         
-        max_diff = 0.0
-        for word in test_words:
-            # Encode word
-            encoded = char_enc.encode(word, char_config['maxlen'])
-            input_tensor = np.array([encoded], dtype=np.float32)
-            
-            # TensorFlow prediction
-            tf_output = tf_model.predict(input_tensor, verbose=0)[0][0]
-            
-            # ONNX prediction
-            onnx_output = session.run([output_name], {input_name: input_tensor})[0][0][0]
-            
-            # Compare
-            diff = abs(tf_output - onnx_output)
-            max_diff = max(max_diff, diff)
-            
+        # Encode words
+        batch = np.array([char_enc.encode_indices(word, char_config['maxlen']) for word in test_words])
+        
+        # ONNX predictions with a single call
+        onnx_outputs = session.run(output_names, {input_name: batch})[0][:, 0]
+        
+        # Compare
+        diffs = np.abs(np.asarray(expected_outputs) - onnx_outputs)
+        max_diff = float(diffs.max())
+        
+        for word, tf_output, onnx_output, diff in zip(test_words, expected_outputs, onnx_outputs, diffs):
             print(f"   {word}: TF={tf_output:.6f}, ONNX={onnx_output:.6f}, diff={diff:.6f}")
         
         if max_diff < 1e-5:
             print(f"   ✅ Models match perfectly! (max diff: {max_diff:.6f})")
-        elif max_diff < 1e-3:
-            print(f"   ✅ Models match well (max diff: {max_diff:.6f})")
+        elif max_diff < tolerance:
+            print(f"   ✅ Models match within tolerance {tolerance:g} (max diff: {max_diff:.6f})")
         else:
-            print(f"   ⚠️  Models differ significantly (max diff: {max_diff:.6f})")
+            raise ConsistencyError(f"{Path(onnx_path).name} differs from TensorFlow beyond "
+                                   f"tolerance {tolerance:g} (max diff: {max_diff:.6f})")
+        
+        return max_diff
             
     except ImportError:
         print("   ⚠️  onnxruntime not available, skipping consistency test")
+        return None
 
-def save_metadata(output_dir, char_config, model):
+def test_lossy_consistency(onnx_path, char_config, test_words, expected_outputs, char_enc, tolerance=1e-2):
+    """Test a reduced precision model against TensorFlow, deleting it if it fails.
+    
+    Returns a (kept, max_diff) tuple, where kept is False if the model
+    differed beyond tolerance and was deleted.
+    """
+    
+    try:
+        return True, test_onnx_consistency(onnx_path, char_config, test_words, expected_outputs,
+                                           char_enc, tolerance=tolerance)
+    except ConsistencyError as e:
+        print(f"   ⚠️  {e}, dropping {Path(onnx_path).name}")
+        Path(onnx_path).unlink()
+        return False, None
+
+def save_metadata(output_dir, char_config, model, files, quantization=None, fp16=None):
     """Save comprehensive model metadata."""
     
+    from syllable.char_encoder import CharacterEncoder
+    
+    # Indices follow the encoder's sorted alphabet, not the config order
+    char_enc = CharacterEncoder(char_config["chars"])
+    
     # Count total parameters
     total_params = model.count_params()
     
@@ -165,26 +610,34 @@ def save_metadata(output_dir, char_config, model):
             "accuracy": "95.82%",
             "total_parameters": int(total_params)
         },
+        "files": files,
         "architecture": {
             "layers": [
                 "Bidirectional GRU (16 units, return_sequences=True)",
                 "GRU (16 units, return_sequences=False)", 
                 "Dense (1 unit, linear activation)"
             ],
-            "input_shape": [None, 18, 28],
+            "input_shape": [None, 18],
             "output_shape": [None, 1]
         },
         "character_encoding": {
-            "alphabet": char_config["chars"],
-            "alphabet_size": len(char_config["chars"]),
+            "alphabet": [char_enc.indices_char[i] for i in range(char_enc.num_chars)],
+            "alphabet_size": char_enc.num_chars,
             "max_word_length": char_config["maxlen"],
-            "encoding": "one-hot"
+            "encoding": "index",
+            "padding_index": char_enc.num_chars,
+            # Character index for every byte value, so runtimes can load the
+            # encoder table directly instead of building it from the alphabet
+            "char_lut": [char_enc.char_indices.get(chr(b), char_enc.num_chars) for b in range(256)]
         },
         "usage": {
-            "input_format": "Float32 tensor of shape [batch_size, 18, 28]",
+            "input": "char_indices",
+            "input_format": "Int32 tensor of shape [batch_size, 18], padded with padding_index",
             "output_format": "Float32 tensor of shape [batch_size, 1]",
-            "preprocessing": "Convert word to lowercase, encode as one-hot character sequence",
-            "postprocessing": "Round to nearest integer, minimum 1 syllable"
+            "count_output": "syllable_count",
+            "count_output_format": "Int32 tensor of shape [batch_size, 1]",
+            "preprocessing": "Convert word to lowercase, encode as alphabet indices, pad to 18 with padding_index",
+            "postprocessing": "Built into the graph: syllable_count = max(1, round(output))"
         },
         "training_info": {
             "dataset": "CMU Pronunciation Dictionary",
@@ -205,6 +658,11 @@ def save_metadata(output_dir, char_config, model):
         }
     }
     
+    if quantization:
+        metadata["quantization"] = quantization
+    if fp16:
+        metadata["fp16"] = fp16
+    
     with open(output_dir / "model_metadata.json", 'w', encoding='utf-8') as f:
         json.dump(metadata, f, indent=2)
 
@@ -217,16 +675,189 @@ def create_usage_examples(output_dir):
 Example: Using the ONNX syllable counting model in Python
 """
 
+import hashlib
+import json
+import os
+import warnings
+
 import numpy as np
 import onnxruntime as ort
-import json
+from onnxruntime.capi import onnxruntime_pybind11_state as ort_state
+from onnxruntime.capi.onnxruntime_pybind11_state import NotImplemented as OrtNotImplemented
+
+def cpu_flags():
+    """Return the CPU feature flags, empty where /proc/cpuinfo doesn't exist."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            return set(f.read().split())
+    except OSError:
+        return set()
+
+CPU_FLAGS = cpu_flags()
+
+# Errors ONNX Runtime raises for models it can't load or files it can't write
+ORT_ERRORS = (RuntimeError, ort_state.Fail, ort_state.InvalidArgument,
+              ort_state.InvalidProtobuf, ort_state.InvalidGraph, ort_state.NoSuchFile)
+
+# Preferred model files
+MODEL_PATHS = ["syllable_model.opt.onnx", "syllable_model.onnx"]
+
+# Opt-in INT8 model, benchmark it on the target before switching
+INT8_MODEL_PATH = "syllable_model.int8.onnx"
+
+# Opt-in FP16 model, only worth it with native FP16 arithmetic
+FP16_MODEL_PATH = "syllable_model.fp16.onnx"
+FP16_CPU_FLAGS = {"avx512_fp16", "asimdhp"}
+
+def find_model(paths=MODEL_PATHS):
+    """Return the first model file that exists."""
+    for path in paths:
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"No model found, tried: {', '.join(paths)}")
+
+# Preferred execution providers, the first ones available are used
+PREFERRED_PROVIDERS = [
+    "TensorrtExecutionProvider",
+    "OpenVINOExecutionProvider",
+    "CoreMLExecutionProvider",
+    "DmlExecutionProvider",
+    "CPUExecutionProvider",
+]
+
+def get_providers(trt_cache_path="trt_cache", openvino_cache_path="openvino_cache"):
+    """Return the available execution providers in order of preference.
+    
+    TensorRT engines and OpenVINO compiled models are cached on disk, so only
+    the first process pays the build and later ones load it directly.
+    """
+    options = {
+        "TensorrtExecutionProvider": {
+            "trt_engine_cache_enable": True,
+            "trt_engine_cache_path": trt_cache_path
+        },
+        "OpenVINOExecutionProvider": {"cache_dir": openvino_cache_path},
+    }
+    available = ort.get_available_providers()
+    return [(p, options[p]) if p in options else p
+            for p in PREFERRED_PROVIDERS if p in available]
+
+def optimized_cache_path(model_bytes):
+    """Return where to cache the optimized graph of the given model.
+
+    The cache lives in the user cache directory, so read-only model
+    directories work and no build artifacts end up next to the model.
+    """
+    cache_dir = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+                             "syllable")
+    os.makedirs(cache_dir, exist_ok=True)
+    # Key on the model contents and the ONNX Runtime version, so a changed
+    # model or an upgraded runtime never loads a stale graph
+    key = hashlib.sha1(model_bytes).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{key}-ort{ort.__version__}.onnx")
+
+def session_options():
+    """Return single threaded session options with all graph optimizations."""
+    # The model is tiny, so a single thread avoids thread pool spin and
+    # synchronization costs that outweigh any parallel speedup
+    opts = ort.SessionOptions()
+    opts.intra_op_num_threads = 1
+    opts.inter_op_num_threads = 1
+    opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    # Inputs are always padded to max_len, so the allocation pattern from
+    # the first run is reused by every later run of the same batch size
+    opts.enable_mem_pattern = True
+    opts.enable_cpu_mem_arena = True
+    return opts
+
+def read_model(model_path):
+    """Return the bytes of the model file."""
+    # Read the whole file up front, so a cold disk cache costs one sequential
+    # read here instead of page faults during the first inference
+    with open(model_path, "rb") as f:
+        return f.read()
+
+def load_cached_session(cache_path, providers):
+    """Create a session from the cached optimized graph, or None on a miss."""
+    try:
+        model_bytes = read_model(cache_path)
+    except FileNotFoundError:
+        return None
+
+    opts = session_options()
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+    try:
+        return ort.InferenceSession(model_bytes, opts, providers=providers)
+    except ORT_ERRORS as e:
+        # A truncated or otherwise broken cache is rebuilt
+        warnings.warn(f"Discarding broken optimized model cache {cache_path}: {e}")
+        os.remove(cache_path)
+        return None
+
+def build_cached_session(model_bytes, cache_path, providers):
+    """Create a session from model_bytes, saving its optimized graph to cache_path."""
+    # Write to a temporary file and move it into place, so other processes
+    # never see a partly written cache
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    opts = session_options()
+    opts.optimized_model_filepath = tmp_path
+    try:
+        session = ort.InferenceSession(model_bytes, opts, providers=providers)
+        os.replace(tmp_path, cache_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return session
+
+def create_session(model_path, providers):
+    """Create a single threaded session, caching the optimized graph on the CPU."""
+    model_bytes = read_model(model_path)
+
+    # Cache the fully optimized graph, so later runs load it directly instead
+    # of optimizing again. The cache may hold optimizations specific to this
+    # machine, so it is never shipped. Only for the CPU provider, graphs
+    # compiled by other providers can't be saved
+    if providers == ["CPUExecutionProvider"]:
+        try:
+            cache_path = optimized_cache_path(model_bytes)
+            session = load_cached_session(cache_path, providers)
+            if session is None:
+                session = build_cached_session(model_bytes, cache_path, providers)
+            return session
+        except (OSError,) + ORT_ERRORS as e:
+            warnings.warn(f"Optimized model cache unavailable, optimizing in memory: {e}")
+
+    return ort.InferenceSession(model_bytes, session_options(), providers=providers)
 
 class SyllableCounter:
-    def __init__(self, model_path="syllable_model.onnx", metadata_path="model_metadata.json"):
-        # Load ONNX model
-        self.session = ort.InferenceSession(model_path)
+    """Counts syllables with the ONNX model.
+    
+    Single word calls encode into input/output buffers bound to the session
+    once, so an instance is not thread-safe. Use one instance per thread.
+    """
+    
+    def __init__(self, model_path=None, metadata_path="model_metadata.json", fp16=False, int8=False):
+        providers = get_providers()
+        
+        # Load ONNX model, trying FP16 first when asked for and the hardware
+        # runs it natively. Inputs and outputs are the same for both models
+        self.session = None
+        native_fp16 = providers[0] != "CPUExecutionProvider" or CPU_FLAGS & FP16_CPU_FLAGS
+        if fp16 and model_path is None and native_fp16 and os.path.exists(FP16_MODEL_PATH):
+            try:
+                self.session = create_session(FP16_MODEL_PATH, providers)
+            except OrtNotImplemented as e:
+                # Some providers lack FP16 kernels for ops like GRU
+                warnings.warn(f"FP16 model failed to load, falling back to FP32: {e}")
+        if self.session is None:
+            if int8 and model_path is None and os.path.exists(INT8_MODEL_PATH):
+                model_path = INT8_MODEL_PATH
+            self.session = create_session(model_path or find_model(), providers)
+        
         self.input_name = self.session.get_inputs()[0].name
-        self.output_name = self.session.get_outputs()[0].name
+        # The graph rounds and clamps the raw output into syllable_count
+        self.output_names = ["syllable_count"]
         
         # Load metadata
         with open(metadata_path) as f:
@@ -234,40 +865,89 @@ class SyllableCounter:
         
         self.chars = metadata["character_encoding"]["alphabet"]
         self.max_len = metadata["character_encoding"]["max_word_length"]
-        self.char_to_idx = {c: i for i, c in enumerate(self.chars)}
-    
-    def encode_word(self, word):
-        """Encode a word to one-hot tensor."""
-        word = word.lower()[:self.max_len]  # Lowercase and truncate
         
-        # Create zero tensor
-        encoded = np.zeros((1, self.max_len, len(self.chars)), dtype=np.float32)
+        self.pad = metadata["character_encoding"]["padding_index"]
         
-        # Set one-hot values
-        for i, char in enumerate(word):
-            if char in self.char_to_idx:
-                encoded[0, i, self.char_to_idx[char]] = 1.0
+        # Byte to character index lookup table, unknown characters pad
+        self.lut = np.array(metadata["character_encoding"]["char_lut"], dtype=np.int32)
         
-        return encoded
+        # Input and output buffers for single words, bound once so each call
+        # reuses them instead of copying arrays across the ORT boundary
+        self._input = np.full((1, self.max_len), self.pad, dtype=np.int32)
+        self._output = np.empty((1, 1), dtype=np.int32)
+        # Length of the word left in the input buffer by the previous call
+        self._input_len = 0
+        # The OrtValues share memory with the NumPy arrays, so writes to
+        # _input are seen by the session and results land in _output
+        self._input_ort = ort.OrtValue.ortvalue_from_numpy(self._input, "cpu", 0)
+        self._output_ort = ort.OrtValue.ortvalue_from_numpy(self._output, "cpu", 0)
+        self._io_binding = self.session.io_binding()
+        self._io_binding.bind_ortvalue_input(self.input_name, self._input_ort)
+        self._io_binding.bind_ortvalue_output(self.output_names[0], self._output_ort)
+    
+    def encode_words(self, words, out=None):
+        """Encode words to a batch of padded character indices, into out if given."""
+        return self._encode_lower([word.lower() for word in words], out)
+    
+    def _encode_lower(self, words, out=None):
+        """Encode already lowercased words, see encode_words."""
+        # Truncate, latin-1 keeps one byte per character. The fixed width
+        # bytes array pads short words with zero bytes, which the lookup
+        # table maps to the padding index
+        b = np.array([word[:self.max_len].encode("latin-1", "replace") for word in words],
+                     dtype=f"S{self.max_len}")
+        codes = b.view(np.uint8).reshape(len(words), self.max_len)
+        
+        # Translate every byte of the batch in one gather
+        return np.take(self.lut, codes, out=out)
+    
+    def encode_word(self, word):
+        """Encode a word to padded character indices."""
+        return self.encode_words([word])
+    
+    def count_syllables(self, words):
+        """Count syllables in a word, or in each word of a list."""
+        if isinstance(words, str):
+            return self._count_word(words)
+        if not words:
+            return []
+        
+        # Blank words have no syllables
+        syllables = self._count_batch([word.lower() for word in words])
+        syllables[[not word.strip() for word in words]] = 0
+        return syllables.tolist()
+    
+    def _count_batch(self, words):
+        """Count syllables in each of a list of lowercased words with a single run."""
+        encoded = self._encode_lower(words)
+        result = self.session.run(self.output_names, {self.input_name: encoded})
+        return result[0][:, 0]
     
-    def count_syllables(self, word):
-        """Count syllables in a word."""
-        if not word or not word.strip():
+    def _count_word(self, word):
+        """Count syllables in a single word using the bound buffers."""
+        if not word.strip():
             return 0
-            
-        encoded = self.encode_word(word)
         
-        # Run inference
-        result = self.session.run([self.output_name], {self.input_name: encoded})
+        # Overwrite the previous word in place and only pad the stale tail,
+        # instead of refilling the whole buffer
+        b = word.lower()[:self.max_len].encode("latin-1", "replace")
+        n = len(b)
+        np.take(self.lut, np.frombuffer(b, dtype=np.uint8), out=self._input[0, :n])
+        if n < self._input_len:
+            self._input[0, n:self._input_len] = self.pad
+        self._input_len = n
         
-        # Round to nearest integer, minimum 1
-        syllables = max(1, round(float(result[0][0][0])))
-        return syllables
+        self.session.run_with_iobinding(self._io_binding)
+        return int(self._output[0, 0])
     
     def count_text(self, text):
         """Count syllables in text (multiple words)."""
-        words = text.split()
-        return [self.count_syllables(word) for word in words]
+        # Lowercase the whole text once, and split() never yields blank
+        # words, so skip the blank word check
+        words = text.lower().split()
+        if not words:
+            return []
+        return self._count_batch(words).tolist()
 
 # Example usage
 if __name__ == "__main__":
@@ -280,8 +960,7 @@ if __name__ == "__main__":
     ]
     
     print("Syllable counting with ONNX model:")
-    for word in test_words:
-        syllables = counter.count_syllables(word)
+    for word, syllables in zip(test_words, counter.count_syllables(test_words)):
         print(f"  {word}: {syllables} syllables")
     
     # Test sentences
@@ -305,26 +984,50 @@ if __name__ == "__main__":
 const ort = require('onnxruntime-node');
 const fs = require('fs');
 
+// Preferred model files, pass syllable_model.int8.onnx explicitly to use INT8
+const MODEL_PATHS = ['./syllable_model.opt.onnx', './syllable_model.onnx'];
+
 class SyllableCounter {
-    constructor(modelPath = './syllable_model.onnx', metadataPath = './model_metadata.json') {
+    constructor(modelPath = null, metadataPath = './model_metadata.json') {
         this.modelPath = modelPath;
         this.metadataPath = metadataPath;
         this.session = null;
+        this.inputName = null;
+        this.outputName = null;
         this.metadata = null;
         this.chars = null;
         this.maxLen = null;
-        this.charToIdx = null;
+        this.pad = null;
+        this.lut = null;
     }
     
     async initialize() {
         // Load ONNX model
-        this.session = await ort.InferenceSession.create(this.modelPath);
+        if (!this.modelPath) {
+            this.modelPath = MODEL_PATHS.find(p => fs.existsSync(p));
+            if (!this.modelPath) throw new Error(`No model found, tried: ${MODEL_PATHS.join(', ')}`);
+        }
+        // The model is tiny, so a single thread avoids thread pool spin and
+        // synchronization costs that outweigh any parallel speedup
+        this.session = await ort.InferenceSession.create(this.modelPath, {
+            intraOpNumThreads: 1,
+            interOpNumThreads: 1,
+            executionMode: 'sequential',
+            graphOptimizationLevel: 'all'
+        });
+        this.inputName = this.session.inputNames[0];
+        // The graph rounds and clamps the raw output into syllable_count
+        this.outputName = 'syllable_count';
         
         // Load metadata
         this.metadata = JSON.parse(fs.readFileSync(this.metadataPath, 'utf8'));
         this.chars = this.metadata.character_encoding.alphabet;
         this.maxLen = this.metadata.character_encoding.max_word_length;
-        this.charToIdx = Object.fromEntries(this.chars.map((c, i) => [c, i]));
+        
+        this.pad = this.metadata.character_encoding.padding_index;
+        
+        // Character code to index lookup table, unknown characters pad
+        this.lut = Int32Array.from(this.metadata.character_encoding.char_lut);
         
         console.log(`Loaded syllable counter with ${this.chars.length} characters, max length ${this.maxLen}`);
     }
@@ -332,40 +1035,52 @@ class SyllableCounter {
     encodeWord(word) {
         word = word.toLowerCase().slice(0, this.maxLen);
         
-        const encoded = new Float32Array(1 * this.maxLen * this.chars.length);
+        const encoded = new Int32Array(this.maxLen).fill(this.pad);
         
         for (let i = 0; i < word.length; i++) {
-            const char = word[i];
-            if (char in this.charToIdx) {
-                const charIdx = this.charToIdx[char];
-                const flatIdx = i * this.chars.length + charIdx;
-                encoded[flatIdx] = 1.0;
-            }
+            const code = word.charCodeAt(i);
+            encoded[i] = code < 256 ? this.lut[code] : this.pad;
         }
         
-        return new ort.Tensor('float32', encoded, [1, this.maxLen, this.chars.length]);
+        return new ort.Tensor('int32', encoded, [1, this.maxLen]);
+    }
+    
+    encodeWords(words) {
+        // One padded row per word, so the whole batch is a single tensor
+        const encoded = new Int32Array(words.length * this.maxLen).fill(this.pad);
+        
+        words.forEach((word, n) => {
+            word = word.toLowerCase().slice(0, this.maxLen);
+            const offset = n * this.maxLen;
+            for (let i = 0; i < word.length; i++) {
+                const code = word.charCodeAt(i);
+                encoded[offset + i] = code < 256 ? this.lut[code] : this.pad;
+            }
+        });
+        
+        return new ort.Tensor('int32', encoded, [words.length, this.maxLen]);
     }
     
     async countSyllables(word) {
         if (!word || !word.trim()) return 0;
         
         const encoded = this.encodeWord(word);
-        const feeds = { [this.session.inputNames[0]]: encoded };
+        const feeds = { [this.inputName]: encoded };
         const results = await this.session.run(feeds);
-        const output = results[this.session.outputNames[0]];
+        const output = results[this.outputName];
         
-        return Math.max(1, Math.round(output.data[0]));
+        return output.data[0];
     }
     
     async countText(text) {
         const words = text.split(/\\s+/).filter(w => w.length > 0);
-        const results = [];
+        if (words.length === 0) return [];
         
-        for (const word of words) {
-            results.push(await this.countSyllables(word));
-        }
+        // Run every word in one batch instead of one session run per word
+        const feeds = { [this.inputName]: this.encodeWords(words) };
+        const results = await this.session.run(feeds, [this.outputName]);
         
-        return results;
+        return Array.from(results[this.outputName].data);
     }
 }
 
@@ -422,12 +1137,24 @@ public class SyllableCounter : IDisposable
     private InferenceSession session;
     private string[] chars;
     private int maxLen;
-    private Dictionary<char, int> charToIdx;
+    private int pad;
+    private int[] lut;
     
+    // Pass syllable_model.opt.onnx as modelPath when a full export produced it
     public SyllableCounter(string modelPath = "syllable_model.onnx", string metadataPath = "model_metadata.json")
     {
+        // The model is tiny, so a single thread avoids thread pool spin and
+        // synchronization costs that outweigh any parallel speedup
+        var options = new SessionOptions
+        {
+            IntraOpNumThreads = 1,
+            InterOpNumThreads = 1,
+            ExecutionMode = ExecutionMode.ORT_SEQUENTIAL,
+            GraphOptimizationLevel = GraphOptimizationLevel.ORT_ENABLE_ALL
+        };
+        
         // Load ONNX model
-        session = new InferenceSession(modelPath);
+        session = new InferenceSession(modelPath, options);
         
         // Load metadata
         var metadataJson = File.ReadAllText(metadataPath);
@@ -435,24 +1162,26 @@ public class SyllableCounter : IDisposable
         
         chars = ((JArray)metadata.character_encoding.alphabet).ToObject<string[]>();
         maxLen = metadata.character_encoding.max_word_length;
-        charToIdx = chars.Select((c, i) => new { c, i }).ToDictionary(x => x.c[0], x => x.i);
+        pad = metadata.character_encoding.padding_index;
+        
+        // Character code to index lookup table, unknown characters pad
+        lut = ((JArray)metadata.character_encoding.char_lut).ToObject<int[]>();
         
         Console.WriteLine($"Loaded syllable counter with {chars.Length} characters, max length {maxLen}");
     }
     
-    private DenseTensor<float> EncodeWord(string word)
+    private DenseTensor<int> EncodeWord(string word)
     {
         word = word.ToLower();
         if (word.Length > maxLen) word = word.Substring(0, maxLen);
         
-        var tensor = new DenseTensor<float>(new[] { 1, maxLen, chars.Length });
+        var tensor = new DenseTensor<int>(new[] { 1, maxLen });
+        tensor.Fill(pad);
         
         for (int i = 0; i < word.Length; i++)
         {
-            if (charToIdx.TryGetValue(word[i], out int charIdx))
-            {
-                tensor[0, i, charIdx] = 1.0f;
-            }
+            char c = word[i];
+            tensor[0, i] = c < 256 ? lut[c] : pad;
         }
         
         return tensor;
@@ -468,10 +1197,9 @@ public class SyllableCounter : IDisposable
             NamedOnnxValue.CreateFromTensor(session.InputMetadata.Keys.First(), encoded)
         };
         
-        using var results = session.Run(inputs);
-        var output = results.First().AsEnumerable<float>().First();
-        
-        return Math.Max(1, (int)Math.Round(output));
+        // The graph rounds and clamps the raw output into syllable_count
+        using var results = session.Run(inputs, new[] { "syllable_count" });
+        return results.First().AsEnumerable<int>().First();
     }
     
     public List<int> CountText(string text)
@@ -548,12 +1276,18 @@ A high-performance, cross-platform syllable counting model exported from TensorF
 - **Architecture**: Bidirectional GRU → GRU → Dense
 - **Parameters**: 6,833 total
 - **Model Size**: ~27 KB
-- **Input**: One-hot encoded character sequences (max 18 chars, 28 char vocabulary)
-- **Output**: Predicted syllable count (float, round to nearest integer)
+- **Input**: Character index sequences (max 18 chars, 28 char vocabulary, index 28 pads)
+- **Output**: Predicted syllable count (`syllable_count`, int32), plus the raw float prediction
 
 ## 📁 Files
 
-- `syllable_model.onnx` - The ONNX model file
+- `syllable_model.opt.onnx` - The ONNX model with graph optimizations applied offline
+- `syllable_model.onnx` - The unoptimized ONNX model, as converted by tf2onnx
+- `syllable_model.int8.onnx` - INT8 quantized model, opt-in in the Python example
+- `syllable_model.int8_static.onnx` - INT8 weights and UINT8 activations, calibrated on CMUdict words
+- `syllable_model.fp16.onnx` - FP16 model with the same int32 `char_indices` input, float32 `dense` and int32 `syllable_count` outputs, for GPU, DirectML and Core ML providers
+- `syllable_model_bs1.onnx`, `syllable_model_bs8.onnx`, `syllable_model_bs32.onnx` - Models with a fixed batch size
+- `syllable_model.ort` - ORT format model for ONNX Runtime Mobile (ARM)
 - `model_metadata.json` - Complete model configuration and metadata
 - `python_example.py` - Python usage example with ONNX Runtime
 - `javascript_example.js` - Node.js usage example
@@ -583,17 +1317,28 @@ dotnet run csharp_example.cs
 
 ## 📊 Character Encoding
 
-Words are encoded as one-hot vectors using this 28-character alphabet:
+Words are encoded as indices into this 28-character alphabet:
 ```
 ' - a b c d e f g h i j k l m n o p q r s t u v w x y z
 ```
 
+Index 28 is padding, used after the end of the word and for characters outside
+the alphabet. The model expands indices to one-hot vectors internally with a
+`Gather`, so callers pass 18 integers per word instead of 504 mostly zero floats.
+
+`character_encoding.char_lut` in `model_metadata.json` holds the index for every
+byte value 0-255, padding included, so encoding a word is one table lookup per
+byte of its lowercased latin-1 encoding.
+
 ## 🔧 Usage Pattern
 
 1. **Preprocess**: Convert word to lowercase, truncate to 18 characters
-2. **Encode**: Convert to one-hot tensor of shape `[1, 18, 28]`
-3. **Predict**: Run through ONNX model
-4. **Postprocess**: Round to nearest integer, minimum 1 syllable
+2. **Encode**: Convert to an int32 `char_indices` tensor of shape `[1, 18]`, padded with 28
+3. **Predict**: Run through ONNX model and read the `syllable_count` output
+
+The model rounds and clamps for you: `syllable_count` is an int32 tensor holding
+`max(1, round(output))`. The raw float prediction is still available as the
+first output.
 
 ## 🌐 Language Support
 
@@ -608,6 +1353,25 @@ This ONNX model works with any language that has ONNX Runtime bindings:
 - **Go**: onnxruntime-go
 - **And many more...**
 
+If the export ran with TensorRT or OpenVINO available, `trt_cache/` and
+`openvino_cache/` hold engines prebuilt with the Python example's own model
+choice and provider options, so the example skips the engine build when run from
+this directory on the same machine. Other hardware, drivers or ONNX Runtime
+versions, or different provider options, build a new engine instead. The Python
+example enables both caches whenever the provider is available, so the engine is
+built once and reused by later processes.
+
+The Python example picks the first available execution provider out of TensorRT,
+OpenVINO, CoreML and DirectML, falling back to the CPU. The default `onnxruntime`
+wheel only ships the CPU provider (plus CoreML on macOS); install
+`onnxruntime-gpu`, `onnxruntime-openvino` or `onnxruntime-directml` instead to
+run the model on a GPU or NPU.
+
+For mobile and edge devices use `syllable_model.ort` with ONNX Runtime Mobile
+(onnxruntime-android, onnxruntime-objc, onnxruntime-react-native). The ORT format
+loads faster and lets you build a reduced runtime with only the operators the
+model needs, listed in `syllable_model.required_operators.config`.
+
 ## 📈 Performance
 
 - **Inference Time**: ~1-5ms per word
@@ -615,6 +1379,64 @@ This ONNX model works with any language that has ONNX Runtime bindings:
 - **Throughput**: 1000+ words/second
 - **Cold Start**: ~100ms
 
+### Threading
+
+All examples run the session on a single thread with sequential execution. The
+model is small enough that per-call overhead dominates, and a thread pool only
+adds synchronization cost to single word latency. For high-throughput batched
+use, raise `intra_op_num_threads` (`intraOpNumThreads`, `IntraOpNumThreads`) to
+the number of physical cores and feed large batches instead.
+
+### Fixed batch size models
+
+The `syllable_model_bs*.onnx` files are the same model with the batch dimension
+fixed. With every shape known up front, ONNX Runtime and execution providers like
+TensorRT and OpenVINO can fold the shape computations and pick shape specialized
+kernels instead of resolving dynamic shapes on every call. For real-time single
+word inference use `syllable_model_bs1.onnx`; pad batches to 8 or 32 words for
+the larger ones.
+
+### INT8 models
+
+The INT8 models trade a small amount of precision (see `quantization` in
+`model_metadata.json`) for integer matrix kernels. ONNX Runtime's quantizer
+doesn't cover GRU, so in `syllable_model.int8.onnx` only the final Dense MatMul
+is INT8 and both GRU layers stay FP32. Expect about the same latency as FP32 even
+on x86 CPUs with VNNI, and worse on ARM-only or TensorFlow Lite stacks without
+fast int8 kernels. Both files are kept, but none of the examples picks them on
+its own. Benchmark on your target first, then use `SyllableCounter(int8=True)`
+in Python or pass the file name explicitly.
+
+### FP16 model
+
+`syllable_model.fp16.onnx` stores weights and activations in FP16 but keeps the
+same interface, the int32 `char_indices` input, the float32 raw `dense` output
+and the int32 `syllable_count` output, so it is a drop-in replacement. It halves weight
+bandwidth on GPUs and on CPUs with native FP16 arithmetic (AVX512-FP16, ARM
+`asimdhp`). The Python example only uses it when asked, with
+`SyllableCounter(fp16=True)`, and falls back to FP32 when the hardware lacks FP16
+support or the provider can't load the model.
+
+### Optimized model
+
+`syllable_model.opt.onnx` already has ONNX Runtime's extended graph optimizations
+(constant folding, redundant node elimination, operator fusion) applied at export
+time, so that work is not repeated on every cold start. Fused nodes may use ONNX
+Runtime contrib operators, so the file is meant for ONNX Runtime only, at the
+version used for the export or newer. If you pin your ONNX Runtime version, ship
+the optimized file and lower `graph_optimization_level` to skip re-optimizing it;
+for other runtimes use `syllable_model.onnx`.
+
+On the CPU provider the Python example also saves the fully optimized graph of the
+model it loads to the user cache directory (`$XDG_CACHE_HOME/syllable`, by default
+`~/.cache/syllable`) on first run, and later runs load it with graph
+optimizations disabled. The file can contain optimizations specific to the
+machine that wrote it, so don't copy it between machines.
+The cache file is named after a hash of the model and the ONNX Runtime version,
+so a changed model or an upgraded runtime gets a fresh cache. A cache file that
+fails to load is deleted and rebuilt, and caching is skipped with a warning when
+the cache directory isn't writable.
+
 ## 🎯 Accuracy Examples
 
 | Word | Predicted | Actual |
@@ -629,6 +1451,12 @@ This ONNX model works with any language that has ONNX Runtime bindings:
 
 ## 🔧 Integration
 
+Batch words wherever you can: one run over N words costs about the same dispatch
+overhead as one run over a single word. Read `syllable_count` for the finished
+counts. If you post-process the raw `dense` output yourself, do it on the whole
+array (`np.maximum(1, np.round(raw)).astype(np.int32)`) rather than word by word,
+and only convert to Python lists at your API boundary.
+
 ### Web APIs
 Use in REST APIs, GraphQL servers, or microservices for real-time syllable counting.
 
@@ -4,25 +4,50 @@ Simple TensorFlow model inference speed test.
 Focuses purely on the neural network performance.
 """
 
+import argparse
+import sys
 import time
 
 import numpy as np
 
+# Words timed by batch_test, one by one and as a single batch
+BATCH_TEST_WORDS = [
+    "cat", "dog", "elephant", "computer", "artificial", "intelligence",
+    "python", "programming", "tensorflow", "machine", "learning", "neural",
+    "network", "syllable", "pronunciation", "dictionary", "algorithm"
+]
+
 
 def main():
-    print("🧠 Loading TensorFlow model...")
-    start_time = time.time()
-    
-    from syllable import ModelSyllableCounter
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", choices=["tf", "onnx"], default="tf",
+                        help="run the model with TensorFlow or ONNX Runtime")
+    args = parser.parse_args()
     
-    msc = ModelSyllableCounter()
+    if args.backend == "onnx":
+        print("🧠 Loading ONNX model...")
+        start_time = time.time()
+        
+        from onnx_backend import OnnxSyllableCounter
+        
+        msc = OnnxSyllableCounter()
+    else:
+        print("🧠 Loading TensorFlow model...")
+        start_time = time.time()
+        
+        from syllable import ModelSyllableCounter
+        
+        msc = ModelSyllableCounter()
     load_time = time.time() - start_time
     print(f"✅ Model loaded in {load_time:.2f} seconds")
     
     # Warm up
     print("🔥 Warming up...")
     for _ in range(5):
-        msc.count_syllables("test")
+        msc.count_syllables("a" * msc.maxlen)
+    # batch_test runs its words as one batch, warm that shape too
+    if hasattr(msc, "count_words"):
+        msc.count_words(["a" * msc.maxlen] * len(BATCH_TEST_WORDS))
     
     print("\n🚀 Model ready! Testing inference speed...")
     print("   Type 'quit' to exit, 'batch' for batch test")
@@ -40,16 +65,19 @@ def main():
             elif not text:
                 continue
             
-            # Multiple runs for more accurate timing
-            times = []
-            results = []
+            # Multiple runs for more accurate timing, with the method and
+            # clock looked up once so the loop only times the inference
+            runs = 10
+            times = np.empty(runs, dtype=np.int64)
+            results = [None] * runs
+            count = msc.count_syllables
+            clock = time.perf_counter_ns
             
-            for _ in range(10):
-                start = time.perf_counter()
-                result = msc.count_syllables(text)
-                end = time.perf_counter()
-                times.append((end - start) * 1000)
-                results.append(result)
+            for i in range(runs):
+                start = clock()
+                results[i] = count(text)
+                times[i] = clock() - start
+            times = times * 1e-6
             
             # Check consistency
             unique_results = set(results)
@@ -62,8 +90,11 @@ def main():
             min_time = np.min(times)
             max_time = np.max(times)
             
-            print(f"   🎯 Result: {result_str}")
-            print(f"   ⚡ Avg: {avg_time:.3f}ms (min: {min_time:.3f}ms, max: {max_time:.3f}ms)")
+            sys.stdout.write(
+                f"   🎯 Result: {result_str}\n"
+                f"   ⚡ Avg: {avg_time:.3f}ms (min: {min_time:.3f}ms, max: {max_time:.3f}ms)\n"
+            )
+            sys.stdout.flush()
             
         except KeyboardInterrupt:
             break
@@ -74,11 +105,7 @@ def main():
 
 def batch_test(msc):
     """Test batch processing performance"""
-    test_words = [
-        "cat", "dog", "elephant", "computer", "artificial", "intelligence",
-        "python", "programming", "tensorflow", "machine", "learning", "neural",
-        "network", "syllable", "pronunciation", "dictionary", "algorithm"
-    ]
+    test_words = BATCH_TEST_WORDS
     
     print(f"\n🏁 Batch testing {len(test_words)} words...")
     
@@ -96,6 +123,16 @@ def batch_test(msc):
     print(f"   📏 Average per word: {avg_per_word:.3f}ms")
     print(f"   🚀 Words per second: {words_per_second:.1f}")
     
+    # One model run for all words, when the backend supports it
+    if hasattr(msc, "count_words"):
+        batch_start = time.perf_counter()
+        msc.count_words(test_words)
+        batch_end = time.perf_counter()
+        
+        batch_time = (batch_end - batch_start) * 1000
+        print(f"   📦 Batched: {batch_time:.2f}ms, "
+              f"{len(test_words) / (batch_time / 1000):.1f} words per second")
+    
     # Test longer text
     long_text = " ".join(test_words)
     start = time.perf_counter()
@@ -0,0 +1,55 @@
+"""
+ONNX Runtime backend for the test scripts.
+Wraps the SyllableCounter from onnx_export/python_example.py so it can stand in
+for ModelSyllableCounter.
+"""
+
+import importlib.util
+import string
+from pathlib import Path
+from typing import List, Tuple
+
+from syllable.syllable_counters import SyllableCounter
+
+EXPORT_DIR = Path(__file__).parent / "onnx_export"
+
+
+def load_example(export_dir=EXPORT_DIR):
+    """Import python_example.py from the export directory."""
+    spec = importlib.util.spec_from_file_location("python_example", export_dir / "python_example.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class OnnxSyllableCounter(SyllableCounter):
+    """Counts syllables using the exported ONNX model."""
+
+    def __init__(self, export_dir=EXPORT_DIR):
+        example = load_example(export_dir)
+        model_path = example.find_model([str(export_dir / p) for p in example.MODEL_PATHS])
+        self.counter = example.SyllableCounter(model_path, str(export_dir / "model_metadata.json"))
+        self.chars = self.counter.chars
+        self.maxlen = self.counter.max_len
+        self.trimchars = ''.join(set(string.punctuation) - set(self.chars))
+
+    def count_syllables(self, word: str) -> Tuple[int, ...]:
+        word = self._clean(word)
+        if word is None:
+            return ()
+        return (self.counter.count_syllables(word),)
+
+    def count_words(self, words: List[str]) -> List[Tuple[int, ...]]:
+        """Counts syllables in each of the given words with a single model run."""
+        cleaned = [self._clean(w) for w in words]
+        valid = [w for w in cleaned if w is not None]
+        counts = iter(self.counter.count_syllables(valid))
+        return [(next(counts),) if w is not None else () for w in cleaned]
+
+    def _clean(self, word):
+        word = word.lower().strip(self.trimchars)
+        if not word or len(word) > self.maxlen:
+            return None
+        if not all(c in self.chars for c in word):
+            return None
+        return word
@@ -15,12 +15,24 @@ public class SyllableCounter : IDisposable
     private InferenceSession session;
     private string[] chars;
     private int maxLen;
-    private Dictionary<char, int> charToIdx;
+    private int pad;
+    private int[] lut;
     
+    // Pass syllable_model.opt.onnx as modelPath when a full export produced it
     public SyllableCounter(string modelPath = "syllable_model.onnx", string metadataPath = "model_metadata.json")
     {
+        // The model is tiny, so a single thread avoids thread pool spin and
+        // synchronization costs that outweigh any parallel speedup
+        var options = new SessionOptions
+        {
+            IntraOpNumThreads = 1,
+            InterOpNumThreads = 1,
+            ExecutionMode = ExecutionMode.ORT_SEQUENTIAL,
+            GraphOptimizationLevel = GraphOptimizationLevel.ORT_ENABLE_ALL
+        };
+        
         // Load ONNX model
-        session = new InferenceSession(modelPath);
+        session = new InferenceSession(modelPath, options);
         
         // Load metadata
         var metadataJson = File.ReadAllText(metadataPath);
@@ -28,24 +40,26 @@ public class SyllableCounter : IDisposable
         
         chars = ((JArray)metadata.character_encoding.alphabet).ToObject<string[]>();
         maxLen = metadata.character_encoding.max_word_length;
-        charToIdx = chars.Select((c, i) => new { c, i }).ToDictionary(x => x.c[0], x => x.i);
+        pad = metadata.character_encoding.padding_index;
+        
+        // Character code to index lookup table, unknown characters pad
+        lut = ((JArray)metadata.character_encoding.char_lut).ToObject<int[]>();
         
         Console.WriteLine($"Loaded syllable counter with {chars.Length} characters, max length {maxLen}");
     }
     
-    private DenseTensor<float> EncodeWord(string word)
+    private DenseTensor<int> EncodeWord(string word)
     {
         word = word.ToLower();
         if (word.Length > maxLen) word = word.Substring(0, maxLen);
         
-        var tensor = new DenseTensor<float>(new[] { 1, maxLen, chars.Length });
+        var tensor = new DenseTensor<int>(new[] { 1, maxLen });
+        tensor.Fill(pad);
         
         for (int i = 0; i < word.Length; i++)
         {
-            if (charToIdx.TryGetValue(word[i], out int charIdx))
-            {
-                tensor[0, i, charIdx] = 1.0f;
-            }
+            char c = word[i];
+            tensor[0, i] = c < 256 ? lut[c] : pad;
         }
         
         return tensor;
@@ -61,10 +75,9 @@ public class SyllableCounter : IDisposable
             NamedOnnxValue.CreateFromTensor(session.InputMetadata.Keys.First(), encoded)
         };
         
-        using var results = session.Run(inputs);
-        var output = results.First().AsEnumerable<float>().First();
-        
-        return Math.Max(1, (int)Math.Round(output));
+        // The graph rounds and clamps the raw output into syllable_count
+        using var results = session.Run(inputs, new[] { "syllable_count" });
+        return results.First().AsEnumerable<int>().First();
     }
     
     public List<int> CountText(string text)
@@ -4,26 +4,50 @@
 const ort = require('onnxruntime-node');
 const fs = require('fs');
 
+// Preferred model files, pass syllable_model.int8.onnx explicitly to use INT8
+const MODEL_PATHS = ['./syllable_model.opt.onnx', './syllable_model.onnx'];
+
 class SyllableCounter {
-    constructor(modelPath = './syllable_model.onnx', metadataPath = './model_metadata.json') {
+    constructor(modelPath = null, metadataPath = './model_metadata.json') {
         this.modelPath = modelPath;
         this.metadataPath = metadataPath;
         this.session = null;
+        this.inputName = null;
+        this.outputName = null;
         this.metadata = null;
         this.chars = null;
         this.maxLen = null;
-        this.charToIdx = null;
+        this.pad = null;
+        this.lut = null;
     }
     
     async initialize() {
         // Load ONNX model
-        this.session = await ort.InferenceSession.create(this.modelPath);
+        if (!this.modelPath) {
+            this.modelPath = MODEL_PATHS.find(p => fs.existsSync(p));
+            if (!this.modelPath) throw new Error(`No model found, tried: ${MODEL_PATHS.join(', ')}`);
+        }
+        // The model is tiny, so a single thread avoids thread pool spin and
+        // synchronization costs that outweigh any parallel speedup
+        this.session = await ort.InferenceSession.create(this.modelPath, {
+            intraOpNumThreads: 1,
+            interOpNumThreads: 1,
+            executionMode: 'sequential',
+            graphOptimizationLevel: 'all'
+        });
+        this.inputName = this.session.inputNames[0];
+        // The graph rounds and clamps the raw output into syllable_count
+        this.outputName = 'syllable_count';
         
         // Load metadata
         this.metadata = JSON.parse(fs.readFileSync(this.metadataPath, 'utf8'));
         this.chars = this.metadata.character_encoding.alphabet;
         this.maxLen = this.metadata.character_encoding.max_word_length;
-        this.charToIdx = Object.fromEntries(this.chars.map((c, i) => [c, i]));
+        
+        this.pad = this.metadata.character_encoding.padding_index;
+        
+        // Character code to index lookup table, unknown characters pad
+        this.lut = Int32Array.from(this.metadata.character_encoding.char_lut);
         
         console.log(`Loaded syllable counter with ${this.chars.length} characters, max length ${this.maxLen}`);
     }
@@ -31,40 +55,52 @@ class SyllableCounter {
     encodeWord(word) {
         word = word.toLowerCase().slice(0, this.maxLen);
         
-        const encoded = new Float32Array(1 * this.maxLen * this.chars.length);
+        const encoded = new Int32Array(this.maxLen).fill(this.pad);
         
         for (let i = 0; i < word.length; i++) {
-            const char = word[i];
-            if (char in this.charToIdx) {
-                const charIdx = this.charToIdx[char];
-                const flatIdx = i * this.chars.length + charIdx;
-                encoded[flatIdx] = 1.0;
-            }
+            const code = word.charCodeAt(i);
+            encoded[i] = code < 256 ? this.lut[code] : this.pad;
         }
         
-        return new ort.Tensor('float32', encoded, [1, this.maxLen, this.chars.length]);
+        return new ort.Tensor('int32', encoded, [1, this.maxLen]);
+    }
+    
+    encodeWords(words) {
+        // One padded row per word, so the whole batch is a single tensor
+        const encoded = new Int32Array(words.length * this.maxLen).fill(this.pad);
+        
+        words.forEach((word, n) => {
+            word = word.toLowerCase().slice(0, this.maxLen);
+            const offset = n * this.maxLen;
+            for (let i = 0; i < word.length; i++) {
+                const code = word.charCodeAt(i);
+                encoded[offset + i] = code < 256 ? this.lut[code] : this.pad;
+            }
+        });
+        
+        return new ort.Tensor('int32', encoded, [words.length, this.maxLen]);
     }
     
     async countSyllables(word) {
         if (!word || !word.trim()) return 0;
         
         const encoded = this.encodeWord(word);
-        const feeds = { [this.session.inputNames[0]]: encoded };
+        const feeds = { [this.inputName]: encoded };
         const results = await this.session.run(feeds);
-        const output = results[this.session.outputNames[0]];
+        const output = results[this.outputName];
         
-        return Math.max(1, Math.round(output.data[0]));
+        return output.data[0];
     }
     
     async countText(text) {
         const words = text.split(/\s+/).filter(w => w.length > 0);
-        const results = [];
+        if (words.length === 0) return [];
         
-        for (const word of words) {
-            results.push(await this.countSyllables(word));
-        }
+        // Run every word in one batch instead of one session run per word
+        const feeds = { [this.inputName]: this.encodeWords(words) };
+        const results = await this.session.run(feeds, [this.outputName]);
         
-        return results;
+        return Array.from(results[this.outputName].data);
     }
 }
 
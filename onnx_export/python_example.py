@@ -3,16 +3,189 @@
 Example: Using the ONNX syllable counting model in Python
 """
 
+import hashlib
+import json
+import os
+import warnings
+
 import numpy as np
 import onnxruntime as ort
-import json
+from onnxruntime.capi import onnxruntime_pybind11_state as ort_state
+from onnxruntime.capi.onnxruntime_pybind11_state import NotImplemented as OrtNotImplemented
+
+def cpu_flags():
+    """Return the CPU feature flags, empty where /proc/cpuinfo doesn't exist."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            return set(f.read().split())
+    except OSError:
+        return set()
+
+CPU_FLAGS = cpu_flags()
+
+# Errors ONNX Runtime raises for models it can't load or files it can't write
+ORT_ERRORS = (RuntimeError, ort_state.Fail, ort_state.InvalidArgument,
+              ort_state.InvalidProtobuf, ort_state.InvalidGraph, ort_state.NoSuchFile)
+
+# Preferred model files
+MODEL_PATHS = ["syllable_model.opt.onnx", "syllable_model.onnx"]
+
+# Opt-in INT8 model, benchmark it on the target before switching
+INT8_MODEL_PATH = "syllable_model.int8.onnx"
+
+# Opt-in FP16 model, only worth it with native FP16 arithmetic
+FP16_MODEL_PATH = "syllable_model.fp16.onnx"
+FP16_CPU_FLAGS = {"avx512_fp16", "asimdhp"}
+
+def find_model(paths=MODEL_PATHS):
+    """Return the first model file that exists."""
+    for path in paths:
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"No model found, tried: {', '.join(paths)}")
+
+# Preferred execution providers, the first ones available are used
+PREFERRED_PROVIDERS = [
+    "TensorrtExecutionProvider",
+    "OpenVINOExecutionProvider",
+    "CoreMLExecutionProvider",
+    "DmlExecutionProvider",
+    "CPUExecutionProvider",
+]
+
+def get_providers(trt_cache_path="trt_cache", openvino_cache_path="openvino_cache"):
+    """Return the available execution providers in order of preference.
+    
+    TensorRT engines and OpenVINO compiled models are cached on disk, so only
+    the first process pays the build and later ones load it directly.
+    """
+    options = {
+        "TensorrtExecutionProvider": {
+            "trt_engine_cache_enable": True,
+            "trt_engine_cache_path": trt_cache_path
+        },
+        "OpenVINOExecutionProvider": {"cache_dir": openvino_cache_path},
+    }
+    available = ort.get_available_providers()
+    return [(p, options[p]) if p in options else p
+            for p in PREFERRED_PROVIDERS if p in available]
+
+def optimized_cache_path(model_bytes):
+    """Return where to cache the optimized graph of the given model.
+
+    The cache lives in the user cache directory, so read-only model
+    directories work and no build artifacts end up next to the model.
+    """
+    cache_dir = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+                             "syllable")
+    os.makedirs(cache_dir, exist_ok=True)
+    # Key on the model contents and the ONNX Runtime version, so a changed
+    # model or an upgraded runtime never loads a stale graph
+    key = hashlib.sha1(model_bytes).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{key}-ort{ort.__version__}.onnx")
+
+def session_options():
+    """Return single threaded session options with all graph optimizations."""
+    # The model is tiny, so a single thread avoids thread pool spin and
+    # synchronization costs that outweigh any parallel speedup
+    opts = ort.SessionOptions()
+    opts.intra_op_num_threads = 1
+    opts.inter_op_num_threads = 1
+    opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    # Inputs are always padded to max_len, so the allocation pattern from
+    # the first run is reused by every later run of the same batch size
+    opts.enable_mem_pattern = True
+    opts.enable_cpu_mem_arena = True
+    return opts
+
+def read_model(model_path):
+    """Return the bytes of the model file."""
+    # Read the whole file up front, so a cold disk cache costs one sequential
+    # read here instead of page faults during the first inference
+    with open(model_path, "rb") as f:
+        return f.read()
+
+def load_cached_session(cache_path, providers):
+    """Create a session from the cached optimized graph, or None on a miss."""
+    try:
+        model_bytes = read_model(cache_path)
+    except FileNotFoundError:
+        return None
+
+    opts = session_options()
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+    try:
+        return ort.InferenceSession(model_bytes, opts, providers=providers)
+    except ORT_ERRORS as e:
+        # A truncated or otherwise broken cache is rebuilt
+        warnings.warn(f"Discarding broken optimized model cache {cache_path}: {e}")
+        os.remove(cache_path)
+        return None
+
+def build_cached_session(model_bytes, cache_path, providers):
+    """Create a session from model_bytes, saving its optimized graph to cache_path."""
+    # Write to a temporary file and move it into place, so other processes
+    # never see a partly written cache
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    opts = session_options()
+    opts.optimized_model_filepath = tmp_path
+    try:
+        session = ort.InferenceSession(model_bytes, opts, providers=providers)
+        os.replace(tmp_path, cache_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return session
+
+def create_session(model_path, providers):
+    """Create a single threaded session, caching the optimized graph on the CPU."""
+    model_bytes = read_model(model_path)
+
+    # Cache the fully optimized graph, so later runs load it directly instead
+    # of optimizing again. The cache may hold optimizations specific to this
+    # machine, so it is never shipped. Only for the CPU provider, graphs
+    # compiled by other providers can't be saved
+    if providers == ["CPUExecutionProvider"]:
+        try:
+            cache_path = optimized_cache_path(model_bytes)
+            session = load_cached_session(cache_path, providers)
+            if session is None:
+                session = build_cached_session(model_bytes, cache_path, providers)
+            return session
+        except (OSError,) + ORT_ERRORS as e:
+            warnings.warn(f"Optimized model cache unavailable, optimizing in memory: {e}")
+
+    return ort.InferenceSession(model_bytes, session_options(), providers=providers)
 
 class SyllableCounter:
-    def __init__(self, model_path="syllable_model.onnx", metadata_path="model_metadata.json"):
-        # Load ONNX model
-        self.session = ort.InferenceSession(model_path)
+    """Counts syllables with the ONNX model.
+    
+    Single word calls encode into input/output buffers bound to the session
+    once, so an instance is not thread-safe. Use one instance per thread.
+    """
+    
+    def __init__(self, model_path=None, metadata_path="model_metadata.json", fp16=False, int8=False):
+        providers = get_providers()
+        
+        # Load ONNX model, trying FP16 first when asked for and the hardware
+        # runs it natively. Inputs and outputs are the same for both models
+        self.session = None
+        native_fp16 = providers[0] != "CPUExecutionProvider" or CPU_FLAGS & FP16_CPU_FLAGS
+        if fp16 and model_path is None and native_fp16 and os.path.exists(FP16_MODEL_PATH):
+            try:
+                self.session = create_session(FP16_MODEL_PATH, providers)
+            except OrtNotImplemented as e:
+                # Some providers lack FP16 kernels for ops like GRU
+                warnings.warn(f"FP16 model failed to load, falling back to FP32: {e}")
+        if self.session is None:
+            if int8 and model_path is None and os.path.exists(INT8_MODEL_PATH):
+                model_path = INT8_MODEL_PATH
+            self.session = create_session(model_path or find_model(), providers)
+        
         self.input_name = self.session.get_inputs()[0].name
-        self.output_name = self.session.get_outputs()[0].name
+        # The graph rounds and clamps the raw output into syllable_count
+        self.output_names = ["syllable_count"]
         
         # Load metadata
         with open(metadata_path) as f:
@@ -20,40 +193,89 @@ class SyllableCounter:
         
         self.chars = metadata["character_encoding"]["alphabet"]
         self.max_len = metadata["character_encoding"]["max_word_length"]
-        self.char_to_idx = {c: i for i, c in enumerate(self.chars)}
-    
-    def encode_word(self, word):
-        """Encode a word to one-hot tensor."""
-        word = word.lower()[:self.max_len]  # Lowercase and truncate
         
-        # Create zero tensor
-        encoded = np.zeros((1, self.max_len, len(self.chars)), dtype=np.float32)
+        self.pad = metadata["character_encoding"]["padding_index"]
         
-        # Set one-hot values
-        for i, char in enumerate(word):
-            if char in self.char_to_idx:
-                encoded[0, i, self.char_to_idx[char]] = 1.0
+        # Byte to character index lookup table, unknown characters pad
+        self.lut = np.array(metadata["character_encoding"]["char_lut"], dtype=np.int32)
         
-        return encoded
+        # Input and output buffers for single words, bound once so each call
+        # reuses them instead of copying arrays across the ORT boundary
+        self._input = np.full((1, self.max_len), self.pad, dtype=np.int32)
+        self._output = np.empty((1, 1), dtype=np.int32)
+        # Length of the word left in the input buffer by the previous call
+        self._input_len = 0
+        # The OrtValues share memory with the NumPy arrays, so writes to
+        # _input are seen by the session and results land in _output
+        self._input_ort = ort.OrtValue.ortvalue_from_numpy(self._input, "cpu", 0)
+        self._output_ort = ort.OrtValue.ortvalue_from_numpy(self._output, "cpu", 0)
+        self._io_binding = self.session.io_binding()
+        self._io_binding.bind_ortvalue_input(self.input_name, self._input_ort)
+        self._io_binding.bind_ortvalue_output(self.output_names[0], self._output_ort)
+    
+    def encode_words(self, words, out=None):
+        """Encode words to a batch of padded character indices, into out if given."""
+        return self._encode_lower([word.lower() for word in words], out)
+    
+    def _encode_lower(self, words, out=None):
+        """Encode already lowercased words, see encode_words."""
+        # Truncate, latin-1 keeps one byte per character. The fixed width
+        # bytes array pads short words with zero bytes, which the lookup
+        # table maps to the padding index
+        b = np.array([word[:self.max_len].encode("latin-1", "replace") for word in words],
+                     dtype=f"S{self.max_len}")
+        codes = b.view(np.uint8).reshape(len(words), self.max_len)
+        
+        # Translate every byte of the batch in one gather
+        return np.take(self.lut, codes, out=out)
+    
+    def encode_word(self, word):
+        """Encode a word to padded character indices."""
+        return self.encode_words([word])
+    
+    def count_syllables(self, words):
+        """Count syllables in a word, or in each word of a list."""
+        if isinstance(words, str):
+            return self._count_word(words)
+        if not words:
+            return []
+        
+        # Blank words have no syllables
+        syllables = self._count_batch([word.lower() for word in words])
+        syllables[[not word.strip() for word in words]] = 0
+        return syllables.tolist()
+    
+    def _count_batch(self, words):
+        """Count syllables in each of a list of lowercased words with a single run."""
+        encoded = self._encode_lower(words)
+        result = self.session.run(self.output_names, {self.input_name: encoded})
+        return result[0][:, 0]
     
-    def count_syllables(self, word):
-        """Count syllables in a word."""
-        if not word or not word.strip():
+    def _count_word(self, word):
+        """Count syllables in a single word using the bound buffers."""
+        if not word.strip():
             return 0
-            
-        encoded = self.encode_word(word)
         
-        # Run inference
-        result = self.session.run([self.output_name], {self.input_name: encoded})
+        # Overwrite the previous word in place and only pad the stale tail,
+        # instead of refilling the whole buffer
+        b = word.lower()[:self.max_len].encode("latin-1", "replace")
+        n = len(b)
+        np.take(self.lut, np.frombuffer(b, dtype=np.uint8), out=self._input[0, :n])
+        if n < self._input_len:
+            self._input[0, n:self._input_len] = self.pad
+        self._input_len = n
         
-        # Round to nearest integer, minimum 1
-        syllables = max(1, round(float(result[0][0][0])))
-        return syllables
+        self.session.run_with_iobinding(self._io_binding)
+        return int(self._output[0, 0])
     
     def count_text(self, text):
         """Count syllables in text (multiple words)."""
-        words = text.split()
-        return [self.count_syllables(word) for word in words]
+        # Lowercase the whole text once, and split() never yields blank
+        # words, so skip the blank word check
+        words = text.lower().split()
+        if not words:
+            return []
+        return self._count_batch(words).tolist()
 
 # Example usage
 if __name__ == "__main__":
@@ -66,8 +288,7 @@ if __name__ == "__main__":
     ]
     
     print("Syllable counting with ONNX model:")
-    for word in test_words:
-        syllables = counter.count_syllables(word)
+    for word, syllables in zip(test_words, counter.count_syllables(test_words)):
         print(f"  {word}: {syllables} syllables")
     
     # Test sentences
@@ -15,6 +15,13 @@ class CharacterEncoder:
             x[i, self.char_indices[c]] = 1
         return x
 
+    def encode_indices(self, text, num_rows):
+        """Encodes strings to character indices, padded with num_chars."""
+        x = np.full(num_rows, self.num_chars, dtype=np.int32)
+        for i, c in enumerate(text):
+            x[i] = self.char_indices[c]
+        return x
+
     def decode(self, mat):
         return ''.join(self.indices_char[i]
                        for row in mat
@@ -2,17 +2,9 @@ import json
 import string
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Iterable, Optional, Tuple
 
 import numpy as np
-try:
-    # Try modern TensorFlow first (2.16+)
-    import tensorflow as tf
-    from tensorflow import keras
-    models = keras.models
-except ImportError:
-    # Fallback for older versions
-    from keras import models
 
 from .char_encoder import CharacterEncoder
 
@@ -75,6 +67,14 @@ class ModelSyllableCounter(SyllableCounter):
         self.chars = j['chars']
         self.maxlen = j['maxlen']
         self.char_enc = CharacterEncoder(self.chars)
+        # Imported here, so the other counters don't pay for importing TensorFlow
+        try:
+            # Try modern TensorFlow first (2.16+)
+            from tensorflow import keras
+            models = keras.models
+        except ImportError:
+            # Fallback for older versions
+            from keras import models
         self.model = models.load_model(model_dir)
         self.trimchars = ''.join(set(string.punctuation) - set(self.chars))
 
@@ -95,7 +95,9 @@ class ModelSyllableCounter(SyllableCounter):
 
 class CompositeSyllableCounter(SyllableCounter):
     """Counts syllables delegating to other syllable counters. Each delegate is
-    tried in order, the first non-empty response is returned.
+    tried in order, the first non-empty response is returned and the remaining
+    delegates are not called. Put cheap counters like CMUdict first, so the model
+    only runs for words they don't know.
     """
     def __init__(self, delegates: Iterable[SyllableCounter]):
         self.delegates = delegates
@@ -105,3 +107,19 @@ class CompositeSyllableCounter(SyllableCounter):
             if counts := delegate.count_syllables(word):
                 return counts
         return ()
+
+    def count_syllables_with_components(
+            self, word: str) -> Tuple[Tuple[int, ...], Tuple[Optional[Tuple[int, ...]], ...]]:
+        """Counts syllables like count_syllables, also returning each delegate's
+        response in delegate order. Delegates after the first non-empty response
+        are not called, their response is None.
+        """
+        counts = ()
+        components = []
+        for delegate in self.delegates:
+            if counts:
+                components.append(None)
+            else:
+                counts = delegate.count_syllables(word)
+                components.append(counts)
+        return counts, tuple(components)
@@ -0,0 +1,22 @@
+import numpy as np
+
+from ..char_encoder import CharacterEncoder
+
+CHARS = "'-abcdefghijklmnopqrstuvwxyz"
+
+def test_encode_indices_pads_with_num_chars():
+    enc = CharacterEncoder(CHARS)
+    x = enc.encode_indices('cat', 6)
+    assert x.dtype == np.int32
+    assert x.shape == (6,)
+    assert list(x[3:]) == [enc.num_chars] * 3
+
+def test_encode_indices_matches_encode():
+    enc = CharacterEncoder(CHARS)
+    for word in ["a", "family", "don't", "x-ray", "abcdefghijklmnopqr"]:
+        onehot = enc.encode(word, 18)
+        indices = enc.encode_indices(word, 18)
+        n = len(word)
+        assert list(indices[:n]) == list(onehot[:n].argmax(axis=1))
+        assert not onehot[n:].any()
+        assert (indices[n:] == enc.num_chars).all()
@@ -0,0 +1,33 @@
+from ..syllable_counters import CompositeSyllableCounter, SyllableCounter
+
+class DictSyllableCounter(SyllableCounter):
+    def __init__(self, d):
+        self.d = d
+        self.calls = []
+
+    def count_syllables(self, word):
+        self.calls.append(word)
+        return self.d.get(word, ())
+
+def test_count_syllables_short_circuits():
+    first = DictSyllableCounter({'family': (2, 3)})
+    second = DictSyllableCounter({'family': (3,), 'zorbly': (2,)})
+    comp = CompositeSyllableCounter([first, second])
+    assert comp.count_syllables('family') == (2, 3)
+    assert second.calls == []
+    assert comp.count_syllables('zorbly') == (2,)
+    assert second.calls == ['zorbly']
+
+def test_count_syllables_with_components_first_hit():
+    first = DictSyllableCounter({'family': (2, 3)})
+    second = DictSyllableCounter({'family': (3,)})
+    comp = CompositeSyllableCounter([first, second])
+    assert comp.count_syllables_with_components('family') == ((2, 3), ((2, 3), None))
+    assert second.calls == []
+
+def test_count_syllables_with_components_fallthrough():
+    first = DictSyllableCounter({})
+    second = DictSyllableCounter({'zorbly': (2,)})
+    comp = CompositeSyllableCounter([first, second])
+    assert comp.count_syllables_with_components('zorbly') == ((2,), ((), (2,)))
+    assert comp.count_syllables_with_components('qq') == ((), ((), ()))